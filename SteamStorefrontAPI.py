@@ -6,11 +6,150 @@ The API is not officially documented and data was compiled from various sources.
 """
 
 import asyncio
+import atexit
 import aiohttp
+import copy
 import json
-from typing import Optional, Dict, List, Any, Union
+import sys
+import time
+import warnings
+from typing import Any
+from collections.abc import Mapping
 from dataclasses import dataclass
-from datetime import datetime
+from types import MappingProxyType
+
+# Fastest available bytes -> objects JSON decoder; decode errors from every
+# backend subclass ValueError, which is what _fetch catches.
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    orjson = None
+    try:
+        import msgspec.json
+        _json_loads = msgspec.json.decode
+    except ImportError:
+        _json_loads = json.loads
+
+# Advertise brotli only when a decoder is installed, otherwise aiohttp cannot
+# decompress what the server sends back.
+try:
+    import brotli  # noqa: F401
+    _ACCEPT_ENCODING = 'br, gzip, deflate'
+except ImportError:
+    _ACCEPT_ENCODING = 'gzip, deflate'
+
+try:
+    import simdjson as _simdjson
+    # Reused across requests; reparsing invalidates previously returned
+    # documents, which is fine because responses are consumed immediately.
+    _PARSER = _simdjson.Parser()
+except ImportError:
+    _simdjson = None
+    _PARSER = None
+
+# Endpoints whose large payloads benefit from lazy (non-materializing) parsing
+_LAZY_ENDPOINTS = frozenset({'appdetails', 'packagedetails'})
+
+
+# Shared default sentinels so from_dict paths never build fresh empties per call.
+# _EMPTY_DICT is only ever a lookup default, never stored on a model: mapping
+# fields exposed on models go through _readonly/_platforms instead.
+_EMPTY_LIST = ()
+_EMPTY_DICT = {}
+
+# (api key, default) pairs for fields copied straight off the appdetails payload
+_APP_FIELDS = (
+    ('steam_appid', 0),
+    ('name', ''),
+    ('type', ''),
+    ('is_free', False),
+    ('detailed_description', ''),
+    ('about_the_game', ''),
+    ('short_description', ''),
+    ('supported_languages', ''),
+    ('header_image', ''),
+    ('website', None),
+    ('background', ''),
+)
+
+# List fields copied off the payload after materializing lazy nodes via _plain()
+_APP_PLAIN_FIELDS = (
+    ('developers', _EMPTY_LIST),
+    ('publishers', _EMPTY_LIST),
+    ('packages', _EMPTY_LIST),
+    ('package_groups', _EMPTY_LIST),
+)
+
+_FEATURED_APP_FIELDS = (
+    ('id', 0),
+    ('type', 0),
+    ('name', ''),
+    ('discounted', False),
+    ('discount_percent', 0),
+    ('original_price', None),
+    ('final_price', 0),
+    ('currency', ''),
+    ('large_capsule_image', ''),
+    ('small_capsule_image', ''),
+    ('windows_available', False),
+    ('mac_available', False),
+    ('linux_available', False),
+    ('streamingvideo_available', False),
+    ('header_image', ''),
+    ('controller_support', ''),
+)
+
+
+# Interned copies of low-cardinality field values (currency codes, app types,
+# controller support levels, genre/category names) so N parsed apps share one
+# string per unique value instead of N freshly-decoded copies.
+_INTERN: dict[str, str] = {}
+
+
+def _i(value):
+    """Intern a low-cardinality string; non-strings pass through unchanged"""
+    if type(value) is not str:
+        return value
+    return _INTERN.setdefault(value, sys.intern(value))
+
+
+def _plain(value):
+    """Materialize a lazily-parsed simdjson node into a plain dict/list.
+
+    Plain dicts and lists pass through unchanged, so from_dict methods work
+    with both parser backends.
+    """
+    if _simdjson is not None:
+        if isinstance(value, _simdjson.Object):
+            return value.as_dict()
+        if isinstance(value, _simdjson.Array):
+            return value.as_list()
+    return value
+
+
+# Canonical read-only platform mappings: only 8 combinations exist, so bulk
+# responses share 8 instances instead of one fresh dict per app.
+_PLATFORM_CACHE: dict[tuple, MappingProxyType] = {}
+_EMPTY_PROXY = MappingProxyType({})
+
+
+def _platforms(data) -> Mapping[str, bool]:
+    """Return the canonical read-only platforms mapping for a payload value"""
+    key = (bool(data.get('windows')), bool(data.get('mac')), bool(data.get('linux')))
+    proxy = _PLATFORM_CACHE.get(key)
+    if proxy is None:
+        proxy = _PLATFORM_CACHE[key] = MappingProxyType(
+            {'windows': key[0], 'mac': key[1], 'linux': key[2]})
+    return proxy
+
+
+def _readonly(value) -> Mapping:
+    """Wrap a payload dict in a read-only view, sharing one empty instance"""
+    value = _plain(value)
+    if not value:
+        return _EMPTY_PROXY
+    return MappingProxyType(value)
 
 
 class SteamStorefrontError(Exception):
@@ -28,7 +167,7 @@ class SteamPackageNotFoundError(SteamStorefrontError):
     pass
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PriceInfo:
     """Represents price information for a Steam product"""
     currency: str
@@ -47,7 +186,7 @@ class PriceInfo:
         return f"{self.final / 100:.2f}"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Screenshot:
     """Represents a screenshot of a Steam app"""
     id: int
@@ -55,32 +194,32 @@ class Screenshot:
     path_full: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Movie:
     """Represents a movie/trailer for a Steam app"""
     id: int
     name: str
     thumbnail: str
-    webm: Dict[str, str]
-    mp4: Dict[str, str]
+    webm: Mapping[str, str]
+    mp4: Mapping[str, str]
     highlight: bool
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Category:
     """Represents a Steam app category"""
     id: int
     description: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Genre:
     """Represents a Steam app genre"""
     id: str
     description: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SteamApp:
     """Represents a Steam application with all its details"""
     steam_appid: int
@@ -92,123 +231,133 @@ class SteamApp:
     short_description: str
     supported_languages: str
     header_image: str
-    website: Optional[str]
-    developers: List[str]
-    publishers: List[str]
-    price_overview: Optional[PriceInfo]
-    packages: List[int]
-    package_groups: List[Dict]
-    platforms: Dict[str, bool]
-    categories: List[Category]
-    genres: List[Genre]
-    screenshots: List[Screenshot]
-    movies: List[Movie]
-    release_date: Dict[str, Any]
-    support_info: Dict[str, str]
+    website: str | None
+    developers: list[str]
+    publishers: list[str]
+    price_overview: PriceInfo | None
+    packages: list[int]
+    package_groups: list[dict]
+    platforms: Mapping[str, bool]
+    categories: list[Category]
+    genres: list[Genre]
+    screenshots: list[Screenshot]
+    movies: list[Movie]
+    release_date: Mapping[str, Any]
+    support_info: Mapping[str, str]
     background: str
-    content_descriptors: Dict
+    content_descriptors: Mapping
     
     @classmethod
-    def from_dict(cls, data: Dict) -> 'SteamApp':
+    def from_dict(cls, data: dict) -> 'SteamApp':
         """Create SteamApp instance from API response data"""
-        # Handle price overview
-        price_overview = None
-        if 'price_overview' in data:
-            price_data = data['price_overview']
-            price_overview = PriceInfo(
-                currency=price_data.get('currency', ''),
-                initial=price_data.get('initial', 0),
-                final=price_data.get('final', 0),
-                discount_percent=price_data.get('discount_percent', 0)
-            )
-        
-        # Handle categories
-        categories = []
-        for cat in data.get('categories', []):
-            categories.append(Category(
+        return _steam_app_from_dict(data)
+
+
+def _compile_app_parser():
+    """Generate a specialized SteamApp parser from the field tables.
+
+    The scalar and passthrough field accesses are unrolled from _APP_FIELDS /
+    _APP_PLAIN_FIELDS into one straight-line call with every key literal
+    constant-folded, and all referenced globals are bound as argument
+    defaults, which CPython resolves faster than module-global lookups.
+    """
+    scalar = ",\n        ".join(
+        "{0}={1}data.get('{0}', {2}){3}".format(
+            key,
+            "_i(" if key == 'type' else "",
+            repr(default),
+            ")" if key == 'type' else "")
+        for key, default in _APP_FIELDS)
+    # list() gives each model its own copy: with the response cache the same
+    # decoded payload backs every hit, so stored sub-lists must not be shared
+    plain = ",\n        ".join(
+        "{0}=list(_plain(data.get('{0}', _EMPTY_LIST)))".format(key)
+        for key, default in _APP_PLAIN_FIELDS)
+    src = f"""
+def _parse(data,
+           cls=SteamApp, PriceInfo=PriceInfo, Category=Category, Genre=Genre,
+           Screenshot=Screenshot, Movie=Movie, _i=_i, _plain=_plain,
+           _platforms=_platforms, _readonly=_readonly,
+           _EMPTY_LIST=_EMPTY_LIST, _EMPTY_DICT=_EMPTY_DICT):
+    price_data = data.get('price_overview')
+    return cls(
+        {scalar},
+        {plain},
+        price_overview=None if price_data is None else PriceInfo(
+            currency=_i(price_data.get('currency', '')),
+            initial=price_data.get('initial', 0),
+            final=price_data.get('final', 0),
+            discount_percent=price_data.get('discount_percent', 0)
+        ),
+        categories=[
+            Category(
                 id=cat.get('id', 0),
-                description=cat.get('description', '')
-            ))
-        
-        # Handle genres
-        genres = []
-        for genre in data.get('genres', []):
-            genres.append(Genre(
-                id=genre.get('id', ''),
-                description=genre.get('description', '')
-            ))
-        
-        # Handle screenshots
-        screenshots = []
-        for screenshot in data.get('screenshots', []):
-            screenshots.append(Screenshot(
+                description=_i(cat.get('description', ''))
+            )
+            for cat in data.get('categories', _EMPTY_LIST)
+        ],
+        genres=[
+            Genre(
+                id=_i(genre.get('id', '')),
+                description=_i(genre.get('description', ''))
+            )
+            for genre in data.get('genres', _EMPTY_LIST)
+        ],
+        screenshots=[
+            Screenshot(
                 id=screenshot.get('id', 0),
                 path_thumbnail=screenshot.get('path_thumbnail', ''),
                 path_full=screenshot.get('path_full', '')
-            ))
-        
-        # Handle movies
-        movies = []
-        for movie in data.get('movies', []):
-            movies.append(Movie(
+            )
+            for screenshot in data.get('screenshots', _EMPTY_LIST)
+        ],
+        movies=[
+            Movie(
                 id=movie.get('id', 0),
                 name=movie.get('name', ''),
                 thumbnail=movie.get('thumbnail', ''),
-                webm=movie.get('webm', {}),
-                mp4=movie.get('mp4', {}),
+                webm=_readonly(movie.get('webm', _EMPTY_DICT)),
+                mp4=_readonly(movie.get('mp4', _EMPTY_DICT)),
                 highlight=movie.get('highlight', False)
-            ))
-        
-        return cls(
-            steam_appid=data.get('steam_appid', 0),
-            name=data.get('name', ''),
-            type=data.get('type', ''),
-            is_free=data.get('is_free', False),
-            detailed_description=data.get('detailed_description', ''),
-            about_the_game=data.get('about_the_game', ''),
-            short_description=data.get('short_description', ''),
-            supported_languages=data.get('supported_languages', ''),
-            header_image=data.get('header_image', ''),
-            website=data.get('website'),
-            developers=data.get('developers', []),
-            publishers=data.get('publishers', []),
-            price_overview=price_overview,
-            packages=data.get('packages', []),
-            package_groups=data.get('package_groups', []),
-            platforms=data.get('platforms', {}),
-            categories=categories,
-            genres=genres,
-            screenshots=screenshots,
-            movies=movies,
-            release_date=data.get('release_date', {}),
-            support_info=data.get('support_info', {}),
-            background=data.get('background', ''),
-            content_descriptors=data.get('content_descriptors', {})
-        )
+            )
+            for movie in data.get('movies', _EMPTY_LIST)
+        ],
+        platforms=_platforms(data.get('platforms', _EMPTY_DICT)),
+        release_date=_readonly(data.get('release_date', _EMPTY_DICT)),
+        support_info=_readonly(data.get('support_info', _EMPTY_DICT)),
+        content_descriptors=_readonly(data.get('content_descriptors', _EMPTY_DICT))
+    )
+"""
+    namespace = {}
+    exec(compile(src, '<generated SteamApp parser>', 'exec'), globals(), namespace)
+    return namespace['_parse']
+
+
+_steam_app_from_dict = _compile_app_parser()
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PackageInfo:
     """Represents a Steam package"""
     name: str
     page_image: str
     header_image: str
     small_logo: str
-    apps: List[Dict]
-    price: Optional[PriceInfo]
-    platforms: Dict[str, bool]
-    controller: Dict
-    release_date: Dict[str, Any]
+    apps: list[dict]
+    price: PriceInfo | None
+    platforms: Mapping[str, bool]
+    controller: Mapping
+    release_date: Mapping[str, Any]
     
     @classmethod
-    def from_dict(cls, data: Dict) -> 'PackageInfo':
+    def from_dict(cls, data: dict) -> 'PackageInfo':
         """Create PackageInfo instance from API response data"""
         # Handle price
         price = None
         if 'price' in data:
             price_data = data['price']
             price = PriceInfo(
-                currency=price_data.get('currency', ''),
+                currency=_i(price_data.get('currency', '')),
                 initial=price_data.get('initial', 0),
                 final=price_data.get('final', 0),
                 discount_percent=price_data.get('discount_percent', 0)
@@ -219,15 +368,15 @@ class PackageInfo:
             page_image=data.get('page_image', ''),
             header_image=data.get('header_image', ''),
             small_logo=data.get('small_logo', ''),
-            apps=data.get('apps', []),
+            apps=list(_plain(data.get('apps', _EMPTY_LIST))),
             price=price,
-            platforms=data.get('platforms', {}),
-            controller=data.get('controller', {}),
-            release_date=data.get('release_date', {})
+            platforms=_platforms(data.get('platforms', _EMPTY_DICT)),
+            controller=_readonly(data.get('controller', _EMPTY_DICT)),
+            release_date=_readonly(data.get('release_date', _EMPTY_DICT))
         )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FeaturedApp:
     """Represents a featured Steam app"""
     id: int
@@ -235,7 +384,7 @@ class FeaturedApp:
     name: str
     discounted: bool
     discount_percent: int
-    original_price: Optional[int]
+    original_price: int | None
     final_price: int
     currency: str
     large_capsule_image: str
@@ -248,83 +397,86 @@ class FeaturedApp:
     controller_support: str
 
 
-@dataclass
+def _compile_featured_app_parser():
+    """Generate a specialized FeaturedApp parser from _FEATURED_APP_FIELDS
+
+    Same straight-line codegen as _compile_app_parser: key literals are
+    constant-folded and globals are bound as argument defaults.
+    """
+    interned = ('currency', 'controller_support')
+    fields = ",\n        ".join(
+        "{0}={1}data.get('{0}', {2}){3}".format(
+            key,
+            "_i(" if key in interned else "",
+            repr(default),
+            ")" if key in interned else "")
+        for key, default in _FEATURED_APP_FIELDS)
+    src = (
+        "def _parse(data, cls=FeaturedApp, _i=_i):\n"
+        "    return cls(\n"
+        f"        {fields}\n"
+        "    )\n"
+    )
+    namespace = {}
+    exec(compile(src, '<generated FeaturedApp parser>', 'exec'), globals(), namespace)
+    return namespace['_parse']
+
+
+# Build a FeaturedApp from one element of a featured/category payload
+_featured_app_from_dict = _compile_featured_app_parser()
+
+
+def _featured_apps_from_list(apps_data) -> list[FeaturedApp]:
+    """Parse a payload list of featured apps into FeaturedApp instances"""
+    return [_featured_app_from_dict(app_data) for app_data in apps_data]
+
+
+try:
+    # Compiled fast path; FeaturedApp is already defined above, so the
+    # circular import resolves against this partially-initialized module.
+    from _fastparse import (
+        featured_app_from_dict as _featured_app_from_dict,
+        featured_apps_from_list as _featured_apps_from_list,
+    )
+except ImportError:
+    pass
+
+
+@dataclass(slots=True, frozen=True)
 class FeaturedApps:
     """Represents the featured apps response"""
-    large_capsules: List[FeaturedApp]
-    featured_win: List[FeaturedApp]
-    featured_mac: List[FeaturedApp]
-    featured_linux: List[FeaturedApp]
+    large_capsules: list[FeaturedApp]
+    featured_win: list[FeaturedApp]
+    featured_mac: list[FeaturedApp]
+    featured_linux: list[FeaturedApp]
     layout: str
     status: int
     
     @classmethod
-    def from_dict(cls, data: Dict) -> 'FeaturedApps':
+    def from_dict(cls, data: dict) -> 'FeaturedApps':
         """Create FeaturedApps instance from API response data"""
-        def parse_apps(apps_data: List[Dict]) -> List[FeaturedApp]:
-            apps = []
-            for app_data in apps_data:
-                apps.append(FeaturedApp(
-                    id=app_data.get('id', 0),
-                    type=app_data.get('type', 0),
-                    name=app_data.get('name', ''),
-                    discounted=app_data.get('discounted', False),
-                    discount_percent=app_data.get('discount_percent', 0),
-                    original_price=app_data.get('original_price'),
-                    final_price=app_data.get('final_price', 0),
-                    currency=app_data.get('currency', ''),
-                    large_capsule_image=app_data.get('large_capsule_image', ''),
-                    small_capsule_image=app_data.get('small_capsule_image', ''),
-                    windows_available=app_data.get('windows_available', False),
-                    mac_available=app_data.get('mac_available', False),
-                    linux_available=app_data.get('linux_available', False),
-                    streamingvideo_available=app_data.get('streamingvideo_available', False),
-                    header_image=app_data.get('header_image', ''),
-                    controller_support=app_data.get('controller_support', '')
-                ))
-            return apps
-        
         return cls(
-            large_capsules=parse_apps(data.get('large_capsules', [])),
-            featured_win=parse_apps(data.get('featured_win', [])),
-            featured_mac=parse_apps(data.get('featured_mac', [])),
-            featured_linux=parse_apps(data.get('featured_linux', [])),
+            large_capsules=_featured_apps_from_list(data.get('large_capsules', _EMPTY_LIST)),
+            featured_win=_featured_apps_from_list(data.get('featured_win', _EMPTY_LIST)),
+            featured_mac=_featured_apps_from_list(data.get('featured_mac', _EMPTY_LIST)),
+            featured_linux=_featured_apps_from_list(data.get('featured_linux', _EMPTY_LIST)),
             layout=data.get('layout', ''),
             status=data.get('status', 0)
         )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FeaturedCategory:
     """Represents a featured category"""
     id: str
     name: str
-    items: List[FeaturedApp]
+    items: list[FeaturedApp]
     
     @classmethod
-    def from_dict(cls, data: Dict) -> 'FeaturedCategory':
+    def from_dict(cls, data: dict) -> 'FeaturedCategory':
         """Create FeaturedCategory instance from API response data"""
-        items = []
-        for item_data in data.get('items', []):
-            items.append(FeaturedApp(
-                id=item_data.get('id', 0),
-                type=item_data.get('type', 0),
-                name=item_data.get('name', ''),
-                discounted=item_data.get('discounted', False),
-                discount_percent=item_data.get('discount_percent', 0),
-                original_price=item_data.get('original_price'),
-                final_price=item_data.get('final_price', 0),
-                currency=item_data.get('currency', ''),
-                large_capsule_image=item_data.get('large_capsule_image', ''),
-                small_capsule_image=item_data.get('small_capsule_image', ''),
-                windows_available=item_data.get('windows_available', False),
-                mac_available=item_data.get('mac_available', False),
-                linux_available=item_data.get('linux_available', False),
-                streamingvideo_available=item_data.get('streamingvideo_available', False),
-                header_image=item_data.get('header_image', ''),
-                controller_support=item_data.get('controller_support', '')
-            ))
-        
+        items = _featured_apps_from_list(data.get('items', _EMPTY_LIST))
+
         return cls(
             id=data.get('id', ''),
             name=data.get('name', ''),
@@ -332,58 +484,190 @@ class FeaturedCategory:
         )
 
 
+def _new_session() -> aiohttp.ClientSession:
+    """Create a client session with a tuned connector for Steam's storefront.
+
+    Generous keep-alives and DNS caching keep connections to
+    store.steampowered.com warm across calls, and compressed transfer is
+    negotiated explicitly (Steam's JSON compresses 5-10x over the wire).
+    """
+    return aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(
+            limit=64,
+            limit_per_host=16,
+            ttl_dns_cache=600,
+            keepalive_timeout=90,
+            enable_cleanup_closed=True
+        ),
+        headers={
+            'Accept': 'application/json',
+            'Accept-Encoding': _ACCEPT_ENCODING
+        }
+    )
+
+
+async def _read_body(response: aiohttp.ClientResponse) -> bytes:
+    """Read the response body, preallocating when the final size is known.
+
+    For uncompressed payloads Content-Length matches the decoded size, so
+    chunks are written straight into one preallocated buffer instead of
+    aiohttp's internal list-of-chunks join. Compressed or unsized responses
+    fall back to response.read(). The decoded bytes go directly to the JSON
+    parser; no intermediate str is ever created.
+    """
+    length = response.content_length
+    if not length or response.headers.get('Content-Encoding'):
+        return await response.read()
+
+    buf = bytearray(length)
+    view = memoryview(buf)
+    offset = 0
+    async for chunk in response.content.iter_any():
+        end = offset + len(chunk)
+        if end > length:
+            # Server sent more than advertised; fall back to concatenation
+            view.release()
+            return bytes(buf[:offset]) + chunk + await response.read()
+        view[offset:end] = chunk
+        offset = end
+    view.release()
+    if offset != length:
+        return bytes(buf[:offset])
+    return bytes(buf)
+
+
 class SteamStorefrontAPI:
     """Main class for interacting with Steam Storefront API"""
     
     BASE_URL = "https://store.steampowered.com/api"
-    
-    def __init__(self, session: Optional[aiohttp.ClientSession] = None):
+
+    # Per-endpoint URLs precomputed once instead of an f-string per request
+    _ENDPOINT_URLS = {
+        'appdetails': f"{BASE_URL}/appdetails",
+        'packagedetails': f"{BASE_URL}/packagedetails",
+        'featured': f"{BASE_URL}/featured",
+        'featuredcategories': f"{BASE_URL}/featuredcategories",
+    }
+
+    def __init__(self, session: aiohttp.ClientSession | None = None,
+                 coalesce_window: float = 0.0, cache_ttl: float = 300.0):
         """Initialize the API client
-        
+
         Args:
             session: Optional aiohttp session. If not provided, a new one will be created.
+            coalesce_window: If greater than zero, concurrent get_app_details
+                calls are collected for this many seconds and merged into a
+                single batched appdetails request per country.
+            cache_ttl: How long (seconds) to serve responses from the
+                in-memory cache before refetching. Set to 0 to disable caching.
         """
         self.session = session
         self._own_session = session is None
+        self._coalesce_window = coalesce_window
+        # country -> {app_id: future} for requests awaiting the next batch
+        self._pending_details: dict[str | None, dict[int, asyncio.Future]] = {}
+        # Strong refs: the loop only holds tasks weakly, so an un-referenced
+        # flush task could be collected before it runs
+        self._flush_tasks: set[asyncio.Task] = set()
+        self._cache_ttl = cache_ttl
+        # (endpoint, sorted params) -> (monotonic timestamp, decoded response)
+        self._cache: dict[tuple, tuple] = {}
+        self._cache_locks: dict[tuple, asyncio.Lock] = {}
     
     async def __aenter__(self):
         if self._own_session:
-            self.session = aiohttp.ClientSession()
+            self.session = _new_session()
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         if self._own_session and self.session:
             await self.session.close()
     
-    async def _make_request(self, endpoint: str, params: Dict) -> Dict:
-        """Make HTTP request to Steam API
-        
+    async def _make_request(self, endpoint: str, params: dict) -> dict:
+        """Make HTTP request to Steam API, serving repeats from the TTL cache
+
         Args:
             endpoint: API endpoint path
             params: Query parameters
-            
+
         Returns:
             JSON response data
-            
+
         Raises:
             SteamStorefrontError: If the request fails
         """
         if not self.session:
             raise SteamStorefrontError("Session not initialized. Use async context manager.")
-        
-        url = f"{self.BASE_URL}/{endpoint}"
-        
+
+        if self._cache_ttl <= 0:
+            return await self._fetch(endpoint, params, allow_lazy=True)
+
+        key = (endpoint, tuple(sorted(params.items())))
+        cached = self._cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < self._cache_ttl:
+            return cached[1]
+
+        # Per-key lock so concurrent requests for the same key share one fetch
+        lock = self._cache_locks.setdefault(key, asyncio.Lock())
         try:
-            async with self.session.get(url, params=params) as response:
-                response.raise_for_status()
-                data = await response.json()
+            async with lock:
+                cached = self._cache.get(key)
+                if cached is not None and time.monotonic() - cached[0] < self._cache_ttl:
+                    return cached[1]
+                # Lazy simdjson documents are invalidated by the next parse, so
+                # only fully-materialized responses go into the cache.
+                data = await self._fetch(endpoint, params, allow_lazy=False)
+                now = time.monotonic()
+                self._evict_expired(now)
+                self._cache[key] = (now, data)
                 return data
+        finally:
+            # Locks only coalesce in-flight fetches; drop them once settled so
+            # the table doesn't keep one lock per unique key forever
+            self._cache_locks.pop(key, None)
+
+    def _evict_expired(self, now: float) -> None:
+        """Drop cache entries whose TTL has lapsed.
+
+        Runs on fetch misses, so a client iterating many distinct keys cleans
+        up behind itself instead of growing the cache without bound.
+        """
+        ttl = self._cache_ttl
+        expired = [key for key, (stamp, _) in self._cache.items()
+                   if now - stamp >= ttl]
+        for key in expired:
+            del self._cache[key]
+
+    async def _fetch(self, endpoint: str, params: dict, allow_lazy: bool) -> dict:
+        """Perform the HTTP request and decode the response body"""
+        url = self._ENDPOINT_URLS.get(endpoint) or f"{self.BASE_URL}/{endpoint}"
+
+        try:
+            async with self.session.get(url, params=params) as response:
+                # Branch on the status directly: raise_for_status would build a
+                # ClientResponseError we immediately swallow and re-raise anyway
+                if response.status >= 400:
+                    raise SteamStorefrontError(
+                        f"HTTP request failed with status {response.status}")
+                raw = await _read_body(response)
+                if allow_lazy and _PARSER is not None and endpoint in _LAZY_ENDPOINTS:
+                    # Lazy parse: sub-trees the from_dict methods never read
+                    # are not materialized into Python objects.
+                    try:
+                        return _PARSER.parse(raw)
+                    except RuntimeError as e:
+                        # pysimdjson refuses to reparse while a previous lazy
+                        # document is still referenced; keep the error inside
+                        # the SteamStorefrontError contract
+                        raise SteamStorefrontError(f"Failed to parse JSON response: {e}")
+                return _json_loads(raw)
         except aiohttp.ClientError as e:
             raise SteamStorefrontError(f"HTTP request failed: {e}")
-        except json.JSONDecodeError as e:
+        except ValueError as e:
+            # orjson.JSONDecodeError and json.JSONDecodeError both subclass ValueError
             raise SteamStorefrontError(f"Failed to decode JSON response: {e}")
     
-    async def get_app_details(self, app_id: int, country: Optional[str] = None) -> SteamApp:
+    async def get_app_details(self, app_id: int, country: str | None = None) -> SteamApp:
         """Get details for a Steam app
         
         Args:
@@ -397,19 +681,173 @@ class SteamStorefrontAPI:
             SteamAppNotFoundError: If the app is not found
             SteamStorefrontError: If the request fails
         """
-        params = {'appids': app_id}
-        if country:
-            params['cc'] = country
-        
+        if self._coalesce_window > 0:
+            return await self._coalesced_app_details(app_id, country)
+
+        results = await self.get_apps_details([app_id], country)
+        if app_id not in results:
+            raise SteamAppNotFoundError(f"App with ID {app_id} not found")
+        return results[app_id]
+
+    async def get_apps_details(self, app_ids: list[int],
+                               country: str | None = None) -> dict[int, SteamApp]:
+        """Get details for several Steam apps in a single request
+
+        The appdetails endpoint accepts a comma-separated appids list, so
+        fetching N apps costs one HTTP round-trip instead of N.
+
+        Args:
+            app_ids: Steam app IDs
+            country: Optional country code (e.g., 'US', 'DE', 'JP')
+
+        Returns:
+            dict mapping app ID to SteamApp; apps that were not found or
+            not successful are omitted
+
+        Raises:
+            SteamStorefrontError: If the request fails
+        """
+        appids = ','.join(map(str, app_ids))
+        params = {'appids': appids} if not country else {'appids': appids, 'cc': country}
+
         data = await self._make_request('appdetails', params)
-        
+
+        results = {}
+        for app_id in app_ids:
+            app_data = data.get(str(app_id))
+            if app_data and app_data.get('success'):
+                results[app_id] = SteamApp.from_dict(app_data['data'])
+        return results
+
+    async def _coalesced_app_details(self, app_id: int,
+                                     country: str | None) -> SteamApp:
+        """Queue a single-app request for the next batched appdetails fetch
+
+        Concurrent calls arriving within the coalesce window share one HTTP
+        request per country; each caller awaits a future resolved when the
+        batch completes.
+        """
+        loop = asyncio.get_running_loop()
+        pending = self._pending_details.get(country)
+        if pending is None:
+            pending = self._pending_details[country] = {}
+            task = loop.create_task(self._flush_pending_details(country))
+            self._flush_tasks.add(task)
+            task.add_done_callback(self._flush_tasks.discard)
+        future = pending.get(app_id)
+        if future is None:
+            future = pending[app_id] = loop.create_future()
+        return await future
+
+    async def _flush_pending_details(self, country: str | None) -> None:
+        """Fire the batched request for all app IDs queued for a country"""
+        await asyncio.sleep(self._coalesce_window)
+        pending = self._pending_details.pop(country)
+        try:
+            results = await self.get_apps_details(list(pending), country)
+        except Exception as e:
+            for future in pending.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for app_id, future in pending.items():
+            if future.done():
+                continue
+            app = results.get(app_id)
+            if app is not None:
+                future.set_result(app)
+            else:
+                future.set_exception(
+                    SteamAppNotFoundError(f"App with ID {app_id} not found"))
+    
+    async def get_app_fields(self, app_id: int, fields: tuple,
+                             country: str | None = None) -> dict:
+        """Get a subset of top-level appdetails fields without building a SteamApp
+
+        Fast path for callers that only need a handful of fields (e.g. a
+        price tracker reading name and price_overview): with the lazy
+        simdjson backend only the requested sub-trees of the large
+        appdetails payload are materialized, and no model objects are built.
+
+        Args:
+            app_id: Steam app ID
+            fields: Top-level appdetails field names to extract
+            country: Optional country code (e.g., 'US', 'DE', 'JP')
+
+        Returns:
+            dict mapping each requested field to its value, or None if absent
+
+        Raises:
+            SteamAppNotFoundError: If the app is not found
+            SteamStorefrontError: If the request fails
+        """
+        params = {'appids': app_id} if not country else {'appids': app_id, 'cc': country}
+
+        data = await self._make_request('appdetails', params)
+
         app_data = data.get(str(app_id))
         if not app_data or not app_data.get('success'):
+            # Drop lazy-document refs so the exception's traceback doesn't
+            # pin them and block the shared simdjson parser's next parse
+            del data, app_data
             raise SteamAppNotFoundError(f"App with ID {app_id} not found")
-        
-        return SteamApp.from_dict(app_data['data'])
-    
-    async def get_package_details(self, package_id: int, country: Optional[str] = None) -> PackageInfo:
+
+        details = app_data['data']
+        # Deep-copy so callers get values detached from the cached payload
+        return {field: copy.deepcopy(_plain(details.get(field))) for field in fields}
+
+    async def get_app_price(self, app_id: int,
+                            country: str | None = None) -> PriceInfo | None:
+        """Get just the price overview for a Steam app
+
+        Args:
+            app_id: Steam app ID
+            country: Optional country code (e.g., 'US', 'DE', 'JP')
+
+        Returns:
+            PriceInfo object, or None if the app has no price (e.g. free to play)
+
+        Raises:
+            SteamAppNotFoundError: If the app is not found
+            SteamStorefrontError: If the request fails
+        """
+        fields = await self.get_app_fields(app_id, ('price_overview',), country)
+        price_data = fields['price_overview']
+        if not price_data:
+            return None
+        return PriceInfo(
+            currency=_i(price_data.get('currency', '')),
+            initial=price_data.get('initial', 0),
+            final=price_data.get('final', 0),
+            discount_percent=price_data.get('discount_percent', 0)
+        )
+
+    async def get_app_details_multi_region(self, app_id: int,
+                                           countries: list[str]) -> dict[str, SteamApp]:
+        """Get details for one app across several regions concurrently
+
+        All region requests are fired in parallel with asyncio.gather, so
+        wall-clock time is one round-trip instead of len(countries).
+
+        Args:
+            app_id: Steam app ID
+            countries: Country codes to query (e.g., ['US', 'DE', 'JP'])
+
+        Returns:
+            dict mapping country code to SteamApp; regions whose lookup
+            failed are omitted
+        """
+        results = await asyncio.gather(
+            *(self.get_app_details(app_id, country) for country in countries),
+            return_exceptions=True
+        )
+        return {
+            country: result
+            for country, result in zip(countries, results)
+            if not isinstance(result, BaseException)
+        }
+
+    async def get_package_details(self, package_id: int, country: str | None = None) -> PackageInfo:
         """Get details for a Steam package
         
         Args:
@@ -423,19 +861,21 @@ class SteamStorefrontAPI:
             SteamPackageNotFoundError: If the package is not found
             SteamStorefrontError: If the request fails
         """
-        params = {'packageids': package_id}
-        if country:
-            params['cc'] = country
-        
+        params = ({'packageids': package_id} if not country
+                  else {'packageids': package_id, 'cc': country})
+
         data = await self._make_request('packagedetails', params)
         
         package_data = data.get(str(package_id))
         if not package_data or not package_data.get('success'):
+            # Drop lazy-document refs so the exception's traceback doesn't
+            # pin them and block the shared simdjson parser's next parse
+            del data, package_data
             raise SteamPackageNotFoundError(f"Package with ID {package_id} not found")
         
         return PackageInfo.from_dict(package_data['data'])
     
-    async def get_featured_apps(self, country: Optional[str] = None) -> FeaturedApps:
+    async def get_featured_apps(self, country: str | None = None) -> FeaturedApps:
         """Get featured apps from Steam
         
         Args:
@@ -447,14 +887,12 @@ class SteamStorefrontAPI:
         Raises:
             SteamStorefrontError: If the request fails
         """
-        params = {}
-        if country:
-            params['cc'] = country
-        
+        params = {} if not country else {'cc': country}
+
         data = await self._make_request('featured', params)
         return FeaturedApps.from_dict(data)
     
-    async def get_featured_categories(self, country: Optional[str] = None) -> List[FeaturedCategory]:
+    async def get_featured_categories(self, country: str | None = None) -> list[FeaturedCategory]:
         """Get featured categories from Steam
         
         Args:
@@ -466,10 +904,8 @@ class SteamStorefrontAPI:
         Raises:
             SteamStorefrontError: If the request fails
         """
-        params = {}
-        if country:
-            params['cc'] = country
-        
+        params = {} if not country else {'cc': country}
+
         data = await self._make_request('featuredcategories', params)
         
         categories = []
@@ -481,11 +917,76 @@ class SteamStorefrontAPI:
 
 
 # Convenience functions for backward compatibility with the original .NET API style
+
+# Shared client backing the compatibility layer, created lazily on first use so
+# repeated compat calls reuse one connection pool instead of paying a fresh
+# TCP + TLS handshake per call.
+_DEFAULT_API: SteamStorefrontAPI | None = None
+_DEFAULT_API_LOOP: asyncio.AbstractEventLoop | None = None
+
+
+def _dispose_session(session: aiohttp.ClientSession,
+                     loop: asyncio.AbstractEventLoop | None) -> None:
+    """Best-effort close of a session whose event loop may already be gone"""
+    if session.closed:
+        return
+    if loop is not None and not loop.is_closed():
+        try:
+            if loop.is_running():
+                asyncio.run_coroutine_threadsafe(session.close(), loop)
+            else:
+                loop.run_until_complete(session.close())
+            return
+        except RuntimeError:
+            pass
+    # The owning loop is gone, so session.close() can never run on it.
+    # connector.close() still closes the pooled transports synchronously
+    # before it fails to schedule its waiter task; detaching afterwards
+    # marks the session closed.
+    connector = session.connector
+    if connector is not None:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)
+            try:
+                connector.close()
+            except RuntimeError:
+                pass
+    session.detach()
+
+
+def _default_api() -> SteamStorefrontAPI:
+    """Return the shared API client, creating it on first use.
+
+    Must be called from within a running event loop. A new client is created
+    if the previous one was closed or belonged to a different event loop; the
+    stale client's session is closed rather than abandoned.
+    """
+    global _DEFAULT_API, _DEFAULT_API_LOOP
+    loop = asyncio.get_running_loop()
+    if (_DEFAULT_API is None
+            or _DEFAULT_API.session.closed
+            or _DEFAULT_API_LOOP is not loop):
+        if _DEFAULT_API is not None:
+            _dispose_session(_DEFAULT_API.session, _DEFAULT_API_LOOP)
+        _DEFAULT_API = SteamStorefrontAPI(session=_new_session())
+        _DEFAULT_API_LOOP = loop
+    return _DEFAULT_API
+
+
+def _close_default_api() -> None:
+    """Close the shared client's session at interpreter exit (best effort)"""
+    if _DEFAULT_API is not None:
+        _dispose_session(_DEFAULT_API.session, _DEFAULT_API_LOOP)
+
+
+atexit.register(_close_default_api)
+
+
 class AppDetails:
     """Static class for app detail operations (compatibility layer)"""
     
     @staticmethod
-    async def get_async(app_id: int, country: Optional[str] = None) -> SteamApp:
+    async def get_async(app_id: int, country: str | None = None) -> SteamApp:
         """Get app details (async)
         
         Args:
@@ -495,15 +996,14 @@ class AppDetails:
         Returns:
             SteamApp object
         """
-        async with SteamStorefrontAPI() as api:
-            return await api.get_app_details(app_id, country)
+        return await _default_api().get_app_details(app_id, country)
 
 
 class PackageDetails:
     """Static class for package detail operations (compatibility layer)"""
     
     @staticmethod
-    async def get_async(package_id: int, country: Optional[str] = None) -> PackageInfo:
+    async def get_async(package_id: int, country: str | None = None) -> PackageInfo:
         """Get package details (async)
         
         Args:
@@ -513,15 +1013,14 @@ class PackageDetails:
         Returns:
             PackageInfo object
         """
-        async with SteamStorefrontAPI() as api:
-            return await api.get_package_details(package_id, country)
+        return await _default_api().get_package_details(package_id, country)
 
 
 class Featured:
     """Static class for featured apps operations (compatibility layer)"""
     
     @staticmethod
-    async def get_async(country: Optional[str] = None) -> FeaturedApps:
+    async def get_async(country: str | None = None) -> FeaturedApps:
         """Get featured apps (async)
         
         Args:
@@ -530,15 +1029,14 @@ class Featured:
         Returns:
             FeaturedApps object
         """
-        async with SteamStorefrontAPI() as api:
-            return await api.get_featured_apps(country)
+        return await _default_api().get_featured_apps(country)
 
 
 class FeaturedCategories:
     """Static class for featured categories operations (compatibility layer)"""
     
     @staticmethod
-    async def get_async(country: Optional[str] = None) -> List[FeaturedCategory]:
+    async def get_async(country: str | None = None) -> list[FeaturedCategory]:
         """Get featured categories (async)
         
         Args:
@@ -547,58 +1045,7 @@ class FeaturedCategories:
         Returns:
             List of FeaturedCategory objects
         """
-        async with SteamStorefrontAPI() as api:
-            return await api.get_featured_categories(country)
+        return await _default_api().get_featured_categories(country)
 
 
-# Example usage
-async def examples():
-    """Example usage of the Steam Storefront API"""
-    
-    # Method 1: Using the main API class (recommended)
-    async with SteamStorefrontAPI() as api:
-        # Get details for SteamApp with ID 460810
-        steam_app1 = await api.get_app_details(460810)
-        print(f"App: {steam_app1.name}")
-        # Get details for SteamApp with ID 322330 for region US
-        steam_app2 = await api.get_app_details(322330, "US")
-        print(f"App: {steam_app2.name}")
-        
-        # Get details for Package with ID 68179
-        package1 = await api.get_package_details(68179)
-        print(f"Package: {package1.name}")
-        
-        # Get details for Package with ID 68179 for region JP
-        package2 = await api.get_package_details(68179, "JP")
-        print(f"Package: {package2.name}")
-        
-        # Get a list of featured games
-        featured = await api.get_featured_apps()
-        print(f"Featured apps: {len(featured.large_capsules)} large capsules")
-        
-        # Get a list of featured games for region DE
-        featured2 = await api.get_featured_apps("DE")
-        print(f"Featured apps (DE): {len(featured2.large_capsules)} large capsules")
-        
-        # Get a list of featured games grouped by category
-        featured_categories = await api.get_featured_categories()
-        print(f"Featured categories: {len(featured_categories)}")
-        
-        # Get a list of featured games grouped by category for region US
-        featured_categories2 = await api.get_featured_categories("US")
-        print(f"Featured categories (US): {len(featured_categories2)}")
-    
-    # Method 2: Using compatibility layer (similar to original .NET API)
-    steam_app1 = await AppDetails.get_async(460810)
-    steam_app2 = await AppDetails.get_async(322330, "US")
-    package1 = await PackageDetails.get_async(68179)
-    package2 = await PackageDetails.get_async(68179, "JP")
-    featured = await Featured.get_async()
-    featured2 = await Featured.get_async("DE")
-    featured_categories = await FeaturedCategories.get_async()
-    featured_categories2 = await FeaturedCategories.get_async("DE")
-
-
-if __name__ == "__main__":
-    # Run examples
-    asyncio.run(examples())
+# Example usage lives in examples.py so importing this module never loads it
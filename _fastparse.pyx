@@ -0,0 +1,41 @@
+# cython: language_level=3
+"""Optional compiled fast path for the hot from_dict parsing loops.
+
+Mirrors the pure-Python parsing in SteamStorefrontAPI; the main module
+falls back to its own implementation when this extension is not built.
+Keep the field lists here in sync with _FEATURED_APP_FIELDS.
+"""
+
+from SteamStorefrontAPI import FeaturedApp, _i
+
+
+cpdef object featured_app_from_dict(dict data):
+    """Build a FeaturedApp from one element of a featured/category payload"""
+    return FeaturedApp(
+        id=data.get('id', 0),
+        type=data.get('type', 0),
+        name=data.get('name', ''),
+        discounted=data.get('discounted', False),
+        discount_percent=data.get('discount_percent', 0),
+        original_price=data.get('original_price'),
+        final_price=data.get('final_price', 0),
+        currency=_i(data.get('currency', '')),
+        large_capsule_image=data.get('large_capsule_image', ''),
+        small_capsule_image=data.get('small_capsule_image', ''),
+        windows_available=data.get('windows_available', False),
+        mac_available=data.get('mac_available', False),
+        linux_available=data.get('linux_available', False),
+        streamingvideo_available=data.get('streamingvideo_available', False),
+        header_image=data.get('header_image', ''),
+        controller_support=_i(data.get('controller_support', ''))
+    )
+
+
+cpdef list featured_apps_from_list(object apps_data):
+    """Parse a payload list of featured apps into FeaturedApp instances"""
+    cdef Py_ssize_t i, n = len(apps_data)
+    # Preallocate: length is known, so no geometric growth reallocations
+    cdef list apps = [None] * n
+    for i in range(n):
+        apps[i] = featured_app_from_dict(apps_data[i])
+    return apps
@@ -0,0 +1,69 @@
+"""
+Example usage of the Steam Storefront API
+
+Kept separate from SteamStorefrontAPI so importing the library never loads
+the example code or its string constants; run this file directly to hit the
+live Steam API.
+"""
+
+import asyncio
+
+from SteamStorefrontAPI import (
+    AppDetails,
+    Featured,
+    FeaturedCategories,
+    PackageDetails,
+    SteamStorefrontAPI,
+)
+
+
+async def examples():
+    """Example usage of the Steam Storefront API"""
+
+    # Method 1: Using the main API class (recommended)
+    async with SteamStorefrontAPI() as api:
+        # Get details for SteamApp with ID 460810
+        steam_app1 = await api.get_app_details(460810)
+        print(f"App: {steam_app1.name}")
+        # Get details for SteamApp with ID 322330 for region US
+        steam_app2 = await api.get_app_details(322330, "US")
+        print(f"App: {steam_app2.name}")
+
+        # Get details for Package with ID 68179
+        package1 = await api.get_package_details(68179)
+        print(f"Package: {package1.name}")
+
+        # Get details for Package with ID 68179 for region JP
+        package2 = await api.get_package_details(68179, "JP")
+        print(f"Package: {package2.name}")
+
+        # Get a list of featured games
+        featured = await api.get_featured_apps()
+        print(f"Featured apps: {len(featured.large_capsules)} large capsules")
+
+        # Get a list of featured games for region DE
+        featured2 = await api.get_featured_apps("DE")
+        print(f"Featured apps (DE): {len(featured2.large_capsules)} large capsules")
+
+        # Get a list of featured games grouped by category
+        featured_categories = await api.get_featured_categories()
+        print(f"Featured categories: {len(featured_categories)}")
+
+        # Get a list of featured games grouped by category for region US
+        featured_categories2 = await api.get_featured_categories("US")
+        print(f"Featured categories (US): {len(featured_categories2)}")
+
+    # Method 2: Using compatibility layer (similar to original .NET API)
+    steam_app1 = await AppDetails.get_async(460810)
+    steam_app2 = await AppDetails.get_async(322330, "US")
+    package1 = await PackageDetails.get_async(68179)
+    package2 = await PackageDetails.get_async(68179, "JP")
+    featured = await Featured.get_async()
+    featured2 = await Featured.get_async("DE")
+    featured_categories = await FeaturedCategories.get_async()
+    featured_categories2 = await FeaturedCategories.get_async("DE")
+
+
+if __name__ == "__main__":
+    # Run examples
+    asyncio.run(examples())
@@ -3,6 +3,13 @@ from setuptools import setup, find_packages
 with open("README.md", "r", encoding="utf-8") as fh:
     long_description = fh.read()
 
+# Optional compiled accelerator; the library works without it
+try:
+    from Cython.Build import cythonize
+    ext_modules = cythonize(["_fastparse.pyx"], language_level=3)
+except ImportError:
+    ext_modules = []
+
 setup(
     name="steam-storefront-api",
     version="1.0.0",
@@ -12,23 +19,27 @@ setup(
     long_description_content_type="text/markdown",
     url="https://github.com/yourusername/steam-storefront-api-python",
     packages=find_packages(),
+    ext_modules=ext_modules,
     classifiers=[
         "Development Status :: 4 - Beta",
         "Intended Audience :: Developers",
         "License :: OSI Approved :: MIT License",
         "Operating System :: OS Independent",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.7",
-        "Programming Language :: Python :: 3.8",
-        "Programming Language :: Python :: 3.9",
         "Programming Language :: Python :: 3.10",
         "Programming Language :: Python :: 3.11",
     ],
-    python_requires=">=3.7",
+    python_requires=">=3.10",
     install_requires=[
         "aiohttp>=3.8.0",
     ],
     extras_require={
+        "fast": [
+            "orjson>=3.6.0",
+            "pysimdjson>=5.0.0",
+            "msgspec>=0.18.0",
+            "brotli>=1.0.0",
+        ],
         "dev": [
             "pytest>=6.0",
             "pytest-asyncio>=0.18.0",